@@ -190,11 +190,7 @@ def vert_woe_binning_eval_fn(
 
     with ctx.tracer.trace_running():
         bining = VertWoeBinning(secure_device)
-        col_index = input_df._col_index(input_data_feature_selects)
-        bin_names = {
-            party: bins if isinstance(bins, list) else [bins]
-            for party, bins in col_index.items()
-        }
+        bin_names = input_df._col_index(input_data_feature_selects)
         rules = bining.binning(
             input_df,
             binning_method,
@@ -274,6 +274,15 @@ class PartitionBase(DataFrameBase):
     def to_pandas(self):
         pass
 
+    @abstractmethod
+    def pandas_dtypes(self) -> PYUObject:
+        """Returns the pandas dtypes of the DataFrame as a dict without revealing it.
+
+        Returns:
+            PYUObject: reference to a dict of {column: pandas dtype}.
+        """
+        pass
+
 
 def partition(data, backend="pandas") -> PartitionBase:
     """Construct a Parititon with input data and backend.
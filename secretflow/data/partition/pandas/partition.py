@@ -231,11 +231,17 @@ class PdPartition(PartitionBase):
     @reveal
     def dtypes(self):
         """Returns the dtypes in the DataFrame."""
+        return self.pandas_dtypes()
+
+    def pandas_dtypes(self) -> PYUObject:
+        """Returns the dtypes of the DataFrame as a dict without revealing it."""
         # return dict always.
         return self.data.device(
-            lambda df: df.dtypes.to_dict()
-            if isinstance(df, pd.DataFrame)
-            else {df.name: df.types}
+            lambda df: (
+                df.dtypes.to_dict()
+                if isinstance(df, pd.DataFrame)
+                else {df.name: df.dtype}
+            )
         )(self.data)
 
     def astype(self, dtype, copy: bool = True, errors: str = "raise"):
@@ -148,6 +148,10 @@ class PolarsPartition(PartitionBase):
 
         return self.data.device(get_dict_dtypes)(self.data)
 
+    def pandas_dtypes(self) -> PYUObject:
+        """Returns the dtypes of the DataFrame after converted to pandas."""
+        return self.data.device(lambda df: df.to_pandas().dtypes.to_dict())(self.data)
+
     def astype(self, dtype, copy: bool = True, errors: str = "raise"):
         def _cast_type(df: pl.DataFrame, _dtype, _copy):
             if _copy:
@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .dataframe import VDataFrame
+from .dataframe import LazyVDataFrame, VDataFrame
 from .io import read_csv
 
 __all__ = [
+    "LazyVDataFrame",
     "VDataFrame",
     "read_csv",
 ]
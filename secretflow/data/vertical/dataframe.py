@@ -12,15 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
-from typing import Dict, List, Union
-
+import weakref
+from dataclasses import dataclass, field
+from functools import reduce
+from itertools import chain
+from operator import methodcaller
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
 import pandas as pd
+from jax.tree_util import tree_map
 from pandas import Index
 
 from secretflow.data.base import DataFrameBase, PartitionBase
 from secretflow.data.ndarray import FedNdarray, PartitionWay
-from secretflow.device import PYU, Device, reveal
+from secretflow.device import PYU, Device, PYUObject, reveal, wait
 from secretflow.utils.errors import InvalidArgumentError, NotFoundError
 
 
@@ -36,6 +42,13 @@ class VDataFrame(DataFrameBase):
     The method with a prefix `partition_` will return a dict
     {pyu of partition: result of partition}.
 
+    Note that `copy`, `drop`, `astype` and `to_pandas` do not share partition
+    objects with the source dataframe, since the inplace methods and
+    `__setitem__` update them. A partition which is not touched by such a
+    method is passed on with `part.copy()`, which only wraps the same
+    (immutable) remote data again and does not submit any task. The exception
+    is `astype(copy=False)` on polars partitions, which casts them in place.
+
     Attributes:
         partitions: a dict of pyu and partition.
         aligned: a boolean indicating whether the data is
@@ -79,9 +92,145 @@ class VDataFrame(DataFrameBase):
     partitions: Dict[PYU, PartitionBase]
     aligned: bool = True
 
+    # Binary ops whose result may contain the columns of other parties.
+    _COL_RESTRICTING_OPS = {'pow', 'subtract'}
+
+    def __post_init__(self):
+        self._invalidate_cache()
+
     def _check_parts(self):
         assert self.partitions, 'Partitions in the VDataFrame is None or empty.'
 
+    def _partitions_key(self) -> tuple:
+        # Refer to the objects weakly rather than by id, ids of freed objects may
+        # be reused by new ones, while a strong reference would keep replaced
+        # partitions and their remote data alive.
+        return tuple(
+            (pyu, weakref.ref(part), weakref.ref(part.data))
+            for pyu, part in self.partitions.items()
+        )
+
+    def _is_cache_key_valid(self) -> bool:
+        """Checks the partitions are still the very objects the cache was built on."""
+        key = self._cache_key
+        if key is None or len(key) != len(self.partitions):
+            return False
+        return all(
+            key_pyu == pyu and key_part() is part and key_data() is part.data
+            for (key_pyu, key_part, key_data), (pyu, part) in zip(
+                key, self.partitions.items()
+            )
+        )
+
+    def _invalidate_cache(self):
+        """Drops the cached metadata, i.e. columns, dtypes, shape, length and owners."""
+        self._cache_key = None
+        self._columns_cache = None
+        self._part_columns_cache = None
+        self._dtypes_cache = None
+        self._shape_cache = None
+        self._len_cache = {}
+        self._col_to_pyu = None
+        self._shared_cols = None
+        self._moments_cache = {}
+
+    def _ensure_cache_valid(self):
+        # Partitions may be replaced or mutated outside of VDataFrame methods,
+        # e.g. `df.partitions[alice] = ...`, so check the partition identities
+        # before trusting the cached metadata.
+        if not self._is_cache_key_valid():
+            self._invalidate_cache()
+            self._cache_key = self._partitions_key()
+
+    def _ensure_part_columns(self) -> Dict[PYU, list]:
+        """Returns the cached columns of each partition."""
+        self._ensure_cache_valid()
+        if self._part_columns_cache is None:
+            self._part_columns_cache = {
+                pyu: part.columns for pyu, part in self.partitions.items()
+            }
+        return self._part_columns_cache
+
+    @staticmethod
+    def _build_col_to_pyu(part_columns: Dict[PYU, list]) -> Dict[str, PYU]:
+        col_to_pyu = {}
+        for pyu, cols in part_columns.items():
+            for col in cols:
+                col_to_pyu.setdefault(col, pyu)
+        return col_to_pyu
+
+    @staticmethod
+    def _build_shared_cols(part_columns: Dict[PYU, list]) -> set:
+        """Returns the columns held by more than one partition."""
+        seen, shared = set(), set()
+        for cols in part_columns.values():
+            for col in cols:
+                (shared if col in seen else seen).add(col)
+        return shared
+
+    def _ensure_col_to_pyu(self) -> Dict[str, PYU]:
+        """Returns the cached mapping from column name to the pyu holding it."""
+        self._ensure_cache_valid()
+        if self._col_to_pyu is None:
+            part_columns = self._ensure_part_columns()
+            self._col_to_pyu = self._build_col_to_pyu(part_columns)
+            self._shared_cols = self._build_shared_cols(part_columns)
+        return self._col_to_pyu
+
+    def _cached_col_to_pyu(self) -> Union[Dict[str, PYU], None]:
+        """Returns the column owners if they are cached and still valid, or None."""
+        if not self._is_cache_key_valid():
+            return None
+        return self._col_to_pyu
+
+    def _update_cache(
+        self,
+        col_to_pyu: Union[Dict[str, PYU], None],
+        dropped: List[str] = (),
+        added: Dict[PYU, List[str]] = None,
+    ):
+        """Invalidates the cache after a modification of the partitions.
+
+        The column owners taken before the modification are kept by removing the
+        dropped columns and adding the added ones, so they need not be rebuilt.
+
+        Args:
+            col_to_pyu: the result of `_cached_col_to_pyu` before the modification.
+            dropped: the dropped columns.
+            added: the added columns of each pyu.
+        """
+        shared_cols = self._shared_cols if col_to_pyu is self._col_to_pyu else None
+        self._invalidate_cache()
+        if col_to_pyu is None or shared_cols is None:
+            return
+        if not shared_cols.isdisjoint(dropped):
+            # A column held by several parties is dropped from some of them only,
+            # the others may still hold it, so leave it to a rebuild.
+            return
+        # Do not update in place, a shallow copy of the dataframe may share it.
+        col_to_pyu = dict(col_to_pyu)
+        for col in dropped:
+            col_to_pyu.pop(col, None)
+        for pyu, cols in (added or {}).items():
+            for col in cols:
+                if col_to_pyu.setdefault(col, pyu) != pyu:
+                    # Duplicated column across parties, leave it to a rebuild.
+                    return
+        self._cache_key = self._partitions_key()
+        self._col_to_pyu = col_to_pyu
+        self._shared_cols = shared_cols
+
+    def _check_col_to_pyu(self):
+        """Checks the cached column owners match the partitions, for debugging."""
+        col_to_pyu = self._cached_col_to_pyu()
+        if col_to_pyu is not None:
+            expected = self._build_col_to_pyu(
+                {pyu: part.columns for pyu, part in self.partitions.items()}
+            )
+            assert (
+                col_to_pyu == expected
+            ), f'Cached column owners {col_to_pyu} differ from {expected}.'
+
     def __concat_reveal_apply(self, fn: str, *args, **kwargs) -> pd.Series:
         """Helper function to concatenate the revealed results of fn applied on each partition.
 
@@ -91,14 +240,120 @@ class VDataFrame(DataFrameBase):
                     takes partition with additional args and kwargs,
                     and returns a Partition object
         """
-        return pd.concat(
-            reveal(
+        # Submit the tasks of all partitions before waiting on any of them.
+        call = methodcaller(fn, *args, **kwargs)
+        handles = [call(part) for part in self.partitions.values()]
+        return self._concat_results(reveal([handle.data for handle in handles]))
+
+    @staticmethod
+    def _concat_results(datas: list) -> pd.Series:
+        """Concatenates the revealed results of the partitions."""
+        if len(datas) == 1:
+            # Nothing to concatenate for a single partition.
+            return datas[0]
+        first = datas[0]
+        if (
+            isinstance(first, pd.Series)
+            and isinstance(first.dtype, np.dtype)
+            and all(
+                isinstance(data, pd.Series)
+                and data.dtype == first.dtype
+                and data.name == first.name
+                for data in datas[1:]
+            )
+        ):
+            # The indexes of vertical partitions are disjoint, so the Series can
+            # be joined directly without the checks and dtype resolution of
+            # pd.concat.
+            return pd.Series(
+                np.concatenate([data.values for data in datas]),
+                index=first.index.append([data.index for data in datas[1:]]),
+                name=first.name,
+            )
+        return pd.concat(datas)
+
+    def _multi_concat_reveal_apply(
+        self, fns: List[str], *args, **kwargs
+    ) -> Dict[str, pd.Series]:
+        """Helper function like `__concat_reveal_apply` but for several fns at once.
+
+        All tasks of all fns are submitted first and revealed with one barrier.
+
+        Args:
+            fns: names of the partition functions, e.g. ['mean', 'std'].
+                Each of them is called with the same args and kwargs.
+
+        Returns:
+            a dict of {fn: concatenated result}.
+        """
+        parts = list(self.partitions.values())
+        calls = [methodcaller(fn, *args, **kwargs) for fn in fns]
+        handles = [[call(part) for part in parts] for call in calls]
+        datas = reveal(
+            [[handle.data for handle in fn_handles] for fn_handles in handles]
+        )
+        return {fn: self._concat_results(fn_datas) for fn, fn_datas in zip(fns, datas)}
+
+    def _fused_moments(self, numeric_only=False) -> pd.DataFrame:
+        """Computes count, mean and var of each column with one task per partition.
+
+        The result is cached until the dataframe is modified.
+
+        Returns:
+            pd.DataFrame: indexed by ['count', 'mean', 'var'] with a column for
+                each column of the dataframe, or None if some selected column is
+                not numeric, since pandas does not support var on e.g. datetime.
+        """
+
+        def _moments(df: pd.DataFrame, numeric_only):
+            if not numeric_only and not all(
+                pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes
+            ):
+                return None
+            mean = df.mean(numeric_only=numeric_only)
+            df = df[mean.index]
+            return pd.DataFrame({'count': df.count(), 'mean': mean, 'var': df.var()}).T
+
+        self._ensure_cache_valid()
+        if numeric_only not in self._moments_cache:
+            datas = reveal(
                 [
-                    getattr(part, fn)(*args, **kwargs).data
-                    for part in self.partitions.values()
+                    pyu(_moments)(part.to_pandas().data, numeric_only)
+                    for pyu, part in self.partitions.items()
                 ]
             )
-        )
+            self._moments_cache[numeric_only] = (
+                None
+                if any(data is None for data in datas)
+                else pd.concat(datas, axis=1)
+            )
+        return self._moments_cache[numeric_only]
+
+    def __moment_apply(self, fn: str, numeric_only=False) -> pd.Series:
+        """Derives mean/var/std/sem from the fused moments of the partitions.
+
+        Falls back to applying fn on each partition if the moments are not
+        worth computing (a lone mean) or may not be computed at all, e.g. var
+        of datetime or timedelta columns.
+        """
+        if any(part.backend != 'pandas' for part in self.partitions.values()):
+            return self.__concat_reveal_apply(fn, numeric_only=numeric_only)
+        self._ensure_cache_valid()
+        if fn == 'mean' and numeric_only not in self._moments_cache:
+            return self.__concat_reveal_apply(fn, numeric_only=numeric_only)
+        moments = self._fused_moments(numeric_only)
+        if moments is None:
+            return self.__concat_reveal_apply(fn, numeric_only=numeric_only)
+        if fn == 'mean':
+            result = moments.loc['mean']
+        else:
+            # Same as pandas: std = sqrt(var) and sem = sqrt(var) / sqrt(count).
+            result = moments.loc['var']
+            if fn in ('std', 'sem'):
+                result = np.sqrt(result)
+            if fn == 'sem':
+                result = result / np.sqrt(moments.loc['count'])
+        return result.rename(None)
 
     def __part_apply(self, fn, *args, **kwargs) -> 'VDataFrame':
         """Helper function to generate a new VDataFrame by applying fn on each partition.
@@ -109,15 +364,23 @@ class VDataFrame(DataFrameBase):
                     and returns a Partition object
         """
 
-        # Note the [par.columns] is here to make sure alice does not see bob's columns.
-        # and it is only effective for subtract two VDataFrames with the same partitions roles and shapes.∂
-        return VDataFrame(
-            {
-                pyu: getattr(part, fn)(*args, **kwargs)[part.columns]
-                for pyu, part in self.partitions.items()
-            },
-            self.aligned,
-        )
+        # Note the reselection is here to make sure alice does not see bob's columns,
+        # e.g. when subtracting a series containing columns of all parties.
+        # It is done on the device of the partition, so no columns are revealed.
+        def _select_columns_like(df, origin):
+            return df[origin.columns]
+
+        need_reselect = fn in self._COL_RESTRICTING_OPS
+        call = methodcaller(fn, *args, **kwargs)
+        new_parts = {}
+        for pyu, part in self.partitions.items():
+            new_part = call(part)
+            if need_reselect:
+                new_part = type(new_part)(
+                    pyu(_select_columns_like)(new_part.data, part.data)
+                )
+            new_parts[pyu] = new_part
+        return VDataFrame(new_parts, self.aligned)
 
     def mode(self, numeric_only=False, dropna=True) -> pd.Series:
         """
@@ -242,10 +505,17 @@ class VDataFrame(DataFrameBase):
         Returns:
             dict: the data type of each column.
         """
-        my_dtypes = {}
-        for part in self.partitions.values():
-            my_dtypes.update(part.to_pandas().dtypes)
-        return my_dtypes
+        self._ensure_cache_valid()
+        if self._dtypes_cache is None:
+            parts_dtypes = reveal(
+                [part.pandas_dtypes() for part in self.partitions.values()]
+            )
+            self._dtypes_cache = {
+                col: dtype
+                for part_dtypes in parts_dtypes
+                for col, dtype in part_dtypes.items()
+            }
+        return dict(self._dtypes_cache)
 
     def astype(self, dtype, copy: bool = True, errors: str = "raise"):
         """
@@ -255,19 +525,28 @@ class VDataFrame(DataFrameBase):
         """
         if isinstance(dtype, dict):
             item_index = self._col_index(list(dtype.keys()))
-            new_parts = {}
-            for pyu, part in self.partitions.items():
-                if pyu not in item_index:
-                    new_parts[pyu] = part.copy()
-                else:
-                    cols = item_index[pyu]
-                    if not isinstance(cols, list):
-                        cols = [cols]
-                    new_parts[pyu] = part.astype(
-                        dtype={col: dtype[col] for col in cols},
-                        copy=copy,
-                        errors=errors,
-                    )
+            # Resolve the dtypes of every pyu first, then submit all casts in a
+            # row without any driver side work in between.
+            task_specs = [
+                (
+                    pyu,
+                    part,
+                    (
+                        {col: dtype[col] for col in item_index[pyu]}
+                        if pyu in item_index
+                        else None
+                    ),
+                )
+                for pyu, part in self.partitions.items()
+            ]
+            new_parts = {
+                pyu: (
+                    part.copy()
+                    if part_dtype is None
+                    else part.astype(dtype=part_dtype, copy=copy, errors=errors)
+                )
+                for pyu, part, part_dtype in task_specs
+            }
             return VDataFrame(partitions=new_parts, aligned=self.aligned)
 
         return VDataFrame(
@@ -284,22 +563,31 @@ class VDataFrame(DataFrameBase):
         The column labels of the DataFrame.
         """
         self._check_parts()
-        cols = None
-        for part in self.partitions.values():
-            if cols is None:
-                cols = part.columns
-            elif isinstance(cols, list):
-                cols.extend(part.columns)
+        self._ensure_cache_valid()
+        if self._columns_cache is None:
+            # Dispatch on the type of the first partition's columns only once,
+            # all partitions of one dataframe return the same type.
+            first, *rest = self._ensure_part_columns().values()
+            if not rest:
+                cols = first
+            elif isinstance(first, Index):
+                # Index.append accepts a list and allocates the result only once.
+                cols = first.append(rest)
             else:
-                cols = cols.append(part.columns)
-        return cols
+                cols = list(chain(first, *rest))
+            self._columns_cache = cols
+        cols = self._columns_cache
+        return list(cols) if isinstance(cols, list) else cols
 
     @property
     def shape(self):
         """Return a tuple representing the dimensionality of the DataFrame."""
         self._check_parts()
-        shapes = [part.shape for part in self.partitions.values()]
-        return shapes[0][0], sum([shape[1] for shape in shapes])
+        self._ensure_cache_valid()
+        if self._shape_cache is None:
+            shapes = [part.shape for part in self.partitions.values()]
+            self._shape_cache = (shapes[0][0], sum([shape[1] for shape in shapes]))
+        return self._shape_cache
 
     def mean(self, numeric_only=False) -> pd.Series:
         """
@@ -312,7 +600,7 @@ class VDataFrame(DataFrameBase):
         Returns:
             pd.Series
         """
-        return self.__concat_reveal_apply("mean", numeric_only=numeric_only)
+        return self.__moment_apply("mean", numeric_only=numeric_only)
 
     # TODO(zoupeicheng.zpc): support in HDataFrame is not scheduled yet
     # TODO(zoupeicheng.zpc): DataFrame variance currently ignore None columns.
@@ -328,7 +616,7 @@ class VDataFrame(DataFrameBase):
         Returns:
             pd.Series
         """
-        return self.__concat_reveal_apply("var", numeric_only=numeric_only)
+        return self.__moment_apply("var", numeric_only=numeric_only)
 
     # TODO(zoupeicheng.zpc): support in HDataFrame is not scheduled yet
     # TODO(zoupeicheng.zpc): DataFrame std currently ignore None columns.
@@ -344,7 +632,7 @@ class VDataFrame(DataFrameBase):
         Returns:
             pd.Series
         """
-        return self.__concat_reveal_apply("std", numeric_only=numeric_only)
+        return self.__moment_apply("std", numeric_only=numeric_only)
 
     # TODO(zoupeicheng.zpc): support in HDataFrame is not scheduled yet
     # TODO(zoupeicheng.zpc): DataFrame sem currently ignore None columns.
@@ -360,7 +648,7 @@ class VDataFrame(DataFrameBase):
         Returns:
             pd.Series
         """
-        return self.__concat_reveal_apply("sem", numeric_only=numeric_only)
+        return self.__moment_apply("sem", numeric_only=numeric_only)
 
     # TODO(zoupeicheng.zpc): support in HDataFrame is not scheduled yet
     # TODO(zoupeicheng.zpc): DataFrame skew currently ignore None columns.
@@ -444,10 +732,41 @@ class VDataFrame(DataFrameBase):
             partition_way=PartitionWay.VERTICAL,
         )
 
+    def column_values(self, columns=None) -> Dict[str, PYUObject]:
+        """
+        Return a Numpy representation of each column.
+
+        Unlike `values`, the columns are not stacked into one 2-D ndarray per
+        partition, so consumers of single columns get contiguous 1-D arrays
+        and only move the columns they use.
+
+        Args:
+            columns: the columns to get, default to all columns.
+
+        Returns:
+            a dict of {column: PYUObject of 1-D numpy.ndarray}.
+        """
+
+        def _column_values(df, cols):
+            return [df[col].to_numpy() for col in cols]
+
+        columns = _listed_columns(self.columns if columns is None else columns)
+        col_values = {}
+        for pyu, cols in self._col_index(columns).items():
+            values = pyu(_column_values, num_returns=len(cols))(
+                self.partitions[pyu].data, cols
+            )
+            if len(cols) == 1:
+                values = [values]
+            col_values.update(zip(cols, values))
+        return {col: col_values[col] for col in columns}
+
     def copy(self) -> 'VDataFrame':
         """
         Shallow copy of this dataframe.
 
+        The partitions are rewrapped without submitting any task.
+
         Returns:
             VDataFrame.
         """
@@ -467,35 +786,42 @@ class VDataFrame(DataFrameBase):
 
         All arguments are same with :py:meth:`pandas.DataFrame.drop`.
 
+        If inplace=True, the tasks of all partitions are submitted first and then
+        waited together, so the method returns after all parties finished.
+
         Returns:
             VDataFrame without the removed index or column labels
             or None if inplace=True.
         """
         if columns:
             col_index = self._col_index(columns)
+            drop_kwargs = dict(
+                labels=labels,
+                axis=axis,
+                index=index,
+                level=level,
+                inplace=inplace,
+                errors=errors,
+            )
             if inplace:
+                col_to_pyu = self._cached_col_to_pyu()
                 for pyu, col in col_index.items():
-                    self.partitions[pyu].drop(
-                        labels=labels,
-                        axis=axis,
-                        index=index,
-                        columns=col,
-                        level=level,
-                        inplace=inplace,
-                        errors=errors,
-                    )
+                    self.partitions[pyu].drop(columns=col, **drop_kwargs)
+                self._update_cache(
+                    col_to_pyu, dropped=list(chain.from_iterable(col_index.values()))
+                )
+                wait([self.partitions[pyu].data for pyu in col_index])
             else:
-                new_parts = self.partitions.copy()
-                for pyu, col in col_index.items():
-                    new_parts[pyu] = self.partitions[pyu].drop(
-                        labels=labels,
-                        axis=axis,
-                        index=index,
-                        columns=col,
-                        level=level,
-                        inplace=inplace,
-                        errors=errors,
+                # Partitions without any column to drop are only rewrapped,
+                # which does not submit any task.
+                new_parts = {
+                    pyu: (
+                        part.drop(columns=col_index[pyu], **drop_kwargs)
+                        if pyu in col_index
+                        else part.copy()
                     )
+                    for pyu, part in self.partitions.items()
+                }
                 return VDataFrame(partitions=new_parts, aligned=self.aligned)
 
         else:
@@ -510,6 +836,8 @@ class VDataFrame(DataFrameBase):
                         inplace=inplace,
                         errors=errors,
                     )
+                self._invalidate_cache()
+                wait([part.data for part in self.partitions.values()])
             else:
                 return self.__part_apply(
                     "drop",
@@ -535,10 +863,14 @@ class VDataFrame(DataFrameBase):
 
         All arguments are same with :py:meth:`pandas.DataFrame.fillna`.
 
+        If inplace=True, the tasks of all partitions are submitted first and then
+        waited together, so the method returns after all parties finished.
+
         Returns:
             VDataFrame with missing values filled or None if inplace=True.
         """
         if inplace:
+            col_to_pyu = self._cached_col_to_pyu()
             for part in self.partitions.values():
                 part.fillna(
                     value=value,
@@ -548,6 +880,8 @@ class VDataFrame(DataFrameBase):
                     limit=limit,
                     downcast=downcast,
                 )
+            self._update_cache(col_to_pyu)
+            wait([part.data for part in self.partitions.values()])
             return self
         else:
             return self.__part_apply(
@@ -571,9 +905,10 @@ class VDataFrame(DataFrameBase):
             Returns a list of PYUObjects whose value is none. You can use
             `secretflow.wait` to wait for the save to complete.
         """
-        for device, uri in fileuris.items():
-            if device not in self.partitions:
-                raise InvalidArgumentError(f'PYU {device} is not in this dataframe.')
+        missing = fileuris.keys() - self.partitions.keys()
+        if missing:
+            device = next(device for device in fileuris if device in missing)
+            raise InvalidArgumentError(f'PYU {device} is not in this dataframe.')
 
         return [
             self.partitions[device].to_csv(uri, **kwargs)
@@ -582,55 +917,82 @@ class VDataFrame(DataFrameBase):
 
     def __len__(self):
         """Return the max length if not aligned."""
-        parts = list(self.partitions.values())
-        assert parts, 'No partitions in VDataFrame.'
-        return max([len(part) for part in parts])
+        assert self.partitions, 'No partitions in VDataFrame.'
+        self._ensure_cache_valid()
+        # The length depends on whether the partitions are aligned, and
+        # `aligned` may be changed without touching the partitions.
+        aligned = bool(self.aligned)
+        if aligned not in self._len_cache:
+            if aligned:
+                # All partitions have the same length.
+                self._len_cache[aligned] = len(next(iter(self.partitions.values())))
+            else:
+                self._len_cache[aligned] = max(
+                    reveal(
+                        [pyu(len)(part.data) for pyu, part in self.partitions.items()]
+                    )
+                )
+        return self._len_cache[aligned]
 
-    def _col_index(self, col) -> Dict[Device, Union[str, List[str]]]:
+    def _col_index(self, col) -> Dict[Device, List[str]]:
+        """Groups the given column(s) by the pyu holding them.
+
+        Returns:
+            a dict of {pyu: list of columns}. The columns are always in a list
+            even if a single column is given.
+        """
         assert (
-            col.tolist() if isinstance(col, Index) else col
+            len(col) if isinstance(col, Index) else col
         ), f'Column to index is None or empty!'
+        listed_col = _listed_columns(col)
+        col_to_pyu = self._ensure_col_to_pyu()
         pyu_col = {}
-        listed_col = col.tolist() if isinstance(col, Index) else col
-        if not isinstance(listed_col, (list, tuple)):
-            listed_col = [listed_col]
         for key in listed_col:
-            found = False
-            for pyu, part in self.partitions.items():
-                if key not in part.dtypes:
-                    continue
-
-                found = True
-                if pyu not in pyu_col:
-                    pyu_col[pyu] = []  # ensure the output is []
-                    pyu_col[pyu].append(key)
-                else:
-                    if not isinstance(pyu_col[pyu], list):
-                        # Convert to list if more than one column.
-                        pyu_col[pyu] = [pyu_col[pyu]]
-                    pyu_col[pyu].append(key)
-
-                break
-
-            if not found:
+            pyu = col_to_pyu.get(key)
+            if pyu is None:
                 raise NotFoundError(f'Item {key} does not exist.')
+            pyu_col.setdefault(pyu, []).append(key)
         return pyu_col
 
+    @classmethod
+    def _from_validated_parts(
+        cls,
+        partitions: Dict[PYU, PartitionBase],
+        part_columns: Dict[PYU, List[str]],
+        aligned: bool = True,
+    ) -> 'VDataFrame':
+        """Builds a VDataFrame whose columns are already known, e.g. a projection.
+
+        Args:
+            partitions: a dict of pyu and partition.
+            part_columns: a dict of pyu and the columns of its partition.
+            aligned: a boolean indicating whether the data is aligned.
+        """
+        df = cls(partitions, aligned)
+        df._cache_key = df._partitions_key()
+        df._part_columns_cache = {pyu: list(cols) for pyu, cols in part_columns.items()}
+        df._columns_cache = list(chain.from_iterable(part_columns.values()))
+        df._col_to_pyu = cls._build_col_to_pyu(part_columns)
+        df._shared_cols = cls._build_shared_cols(part_columns)
+        return df
+
     def __getitem__(self, item) -> 'VDataFrame':
         item_index = self._col_index(item)
-        return VDataFrame(
-            partitions={
-                pyu: self.partitions[pyu][keys] for pyu, keys in item_index.items()
-            }
-        )
+        partitions = self.partitions
+        new_parts = {}
+        for pyu, keys in item_index.items():
+            new_parts[pyu] = partitions[pyu][keys]
+        return VDataFrame._from_validated_parts(new_parts, item_index, self.aligned)
 
     def __setitem__(self, key, value):
+        col_to_pyu = self._cached_col_to_pyu()
+        added = None
         if isinstance(value, PartitionBase):
             assert (
                 value.data.device in self.partitions
             ), 'Device of the partition to assgin is not in this dataframe devices.'
             self.partitions[value.data.device][key] = value
-            return
+            added = {value.data.device: _listed_columns(key)}
         elif isinstance(value, VDataFrame):
             for pyu in value.partitions.keys():
                 assert (
@@ -638,22 +1000,22 @@ class VDataFrame(DataFrameBase):
                 ), 'Partitions to assgin is not same with this dataframe partitions.'
             try:
                 key_index = self._col_index(key)
-                for pyu, col in key_index.items():
-                    self.partitions[pyu][col] = (
-                        value.partitions[pyu]
-                        if isinstance(value, VDataFrame)
-                        else value
-                    )
+                col_to_pyu = self._cached_col_to_pyu()
+                # One assignment per pyu with all of its columns.
+                for pyu, cols in key_index.items():
+                    self.partitions[pyu][cols] = value.partitions[pyu]
             except NotFoundError:
                 # Insert as a new key if not seen.
-                for pyu, part in value.partitions.items():
-                    self.partitions[pyu][list(part.dtypes.keys())] = part
+                col_to_pyu = self._cached_col_to_pyu()
+                added = value._col_index(value.columns)
+                for pyu, cols in added.items():
+                    self.partitions[pyu][cols] = value.partitions[pyu]
         else:
             key_index = self._col_index(key)
-            for pyu, col in key_index.items():
-                self.partitions[pyu][col] = (
-                    value.partitions[pyu] if isinstance(value, VDataFrame) else value
-                )
+            col_to_pyu = self._cached_col_to_pyu()
+            for pyu, cols in key_index.items():
+                self.partitions[pyu][cols] = value
+        self._update_cache(col_to_pyu, added=added)
 
     @reveal
     def partition_shape(self):
@@ -675,11 +1037,256 @@ class VDataFrame(DataFrameBase):
         """
         assert len(self.partitions) > 0, 'Partitions in the dataframe is None or empty.'
         return {
-            device: partition.columns for device, partition in self.partitions.items()
+            device: list(cols) if isinstance(cols, list) else cols
+            for device, cols in self._ensure_part_columns().items()
         }
 
     def to_pandas(self):
+        """Converts the partitions to the pandas backend.
+
+        The data stays in the devices, use `reveal_to_pandas` to get a local
+        pandas.DataFrame.
+
+        Returns:
+            VDataFrame.
+        """
         return VDataFrame(
-            {pyu: part.to_pandas() for pyu, part in self.partitions.items()},
+            # Pandas partitions return themselves, rewrap them so that the new
+            # dataframe can be modified in place independently.
+            {pyu: part.to_pandas().copy() for pyu, part in self.partitions.items()},
             self.aligned,
         )
+
+    def reveal_to_pandas(self) -> pd.DataFrame:
+        """Reveals all partitions and concatenates them into one pandas.DataFrame.
+
+        NOTE: Use this function with extreme caution, as it reveals all data of
+        the dataframe to the driver.
+
+        Returns:
+            pd.DataFrame.
+        """
+        datas = reveal([part.to_pandas().data for part in self.partitions.values()])
+        # Columns of the partitions are disjoint, so skip copying the blocks.
+        return pd.concat(datas, axis=1, copy=False)
+
+    def lazy(self) -> 'LazyVDataFrame':
+        """Returns a LazyVDataFrame to chain transforms which run on `collect`.
+
+        Returns:
+            LazyVDataFrame.
+        """
+        return LazyVDataFrame(self)
+
+
+def _listed_columns(columns) -> List[str]:
+    columns = columns.tolist() if isinstance(columns, Index) else columns
+    if not isinstance(columns, (list, tuple)):
+        columns = [columns]
+    return list(columns)
+
+
+def _lazy_apply_ops(
+    df: pd.DataFrame, ops: List[Tuple[str, tuple, dict]]
+) -> pd.DataFrame:
+    """Applies the deferred ops of a LazyVDataFrame on a local pandas.DataFrame."""
+
+    def _apply(df: pd.DataFrame, op):
+        fn, args, kwargs = op
+        if fn == 'copy':
+            return df
+        if fn == 'astype' and isinstance(kwargs['dtype'], dict):
+            dtype = {col: t for col, t in kwargs['dtype'].items() if col in df}
+            if not dtype:
+                return df
+            kwargs = {**kwargs, 'dtype': dtype}
+        elif fn == 'drop' and kwargs['columns'] is not None:
+            columns = [col for col in kwargs['columns'] if col in df]
+            if not columns:
+                return df
+            kwargs = {**kwargs, 'columns': columns}
+
+        new_df = getattr(pd.DataFrame, fn)(df, *args, **kwargs)
+        if fn in VDataFrame._COL_RESTRICTING_OPS:
+            # Make sure alice does not see bob's columns.
+            new_df = new_df[df.columns]
+        return new_df
+
+    return reduce(_apply, ops, df)
+
+
+def _merge_disjoint_ops(last: tuple, op: tuple) -> Union[tuple, None]:
+    """Merges two adjacent astype(dict)/drop(columns) ops on disjoint columns.
+
+    Returns:
+        the merged op or None if they can not be merged.
+    """
+    fn, args, kwargs = op
+    last_fn, last_args, last_kwargs = last
+    if fn != last_fn or args or last_args:
+        return None
+    if fn == 'astype':
+        key = 'dtype'
+        if not isinstance(kwargs[key], dict) or not isinstance(last_kwargs[key], dict):
+            return None
+    elif fn == 'drop':
+        key = 'columns'
+        if kwargs[key] is None or last_kwargs[key] is None:
+            return None
+        if any(
+            kw[k] is not None
+            for kw in (kwargs, last_kwargs)
+            for k in ('labels', 'index')
+        ):
+            return None
+    else:
+        return None
+    if any(kwargs[k] != last_kwargs[k] for k in kwargs if k != key):
+        return None
+    if set(kwargs[key]) & set(last_kwargs[key]):
+        return None
+
+    if fn == 'astype':
+        merged = {**last_kwargs[key], **kwargs[key]}
+    else:
+        merged = last_kwargs[key] + kwargs[key]
+    return fn, args, {**kwargs, key: merged}
+
+
+@dataclass
+class LazyVDataFrame:
+    """A VDataFrame with a chain of deferred transforms.
+
+    The transforms are only recorded until `collect` is called, which runs the
+    whole chain in one task per partition instead of one task per transform.
+
+    Attributes:
+        base: the VDataFrame to transform.
+        ops: the deferred transforms as a list of (fn, args, kwargs).
+
+    Examples:
+        >>> v_df.lazy().fillna(0).astype({'a3': np.int32}).drop(columns='b5').collect()
+    """
+
+    base: VDataFrame
+    ops: List[Tuple[str, tuple, dict]] = field(default_factory=list)
+
+    def _append(self, fn: str, *args, **kwargs) -> 'LazyVDataFrame':
+        return LazyVDataFrame(self.base, self.ops + [(fn, args, kwargs)])
+
+    def pow(self, *args, **kwargs) -> 'LazyVDataFrame':
+        """Deferred :py:meth:`VDataFrame.pow`."""
+        return self._append('pow', *args, **kwargs)
+
+    def round(self, *args, **kwargs) -> 'LazyVDataFrame':
+        """Deferred :py:meth:`VDataFrame.round`."""
+        return self._append('round', *args, **kwargs)
+
+    def replace(self, *args, **kwargs) -> 'LazyVDataFrame':
+        """Deferred :py:meth:`VDataFrame.replace`."""
+        return self._append('replace', *args, **kwargs)
+
+    def subtract(self, *args, **kwargs) -> 'LazyVDataFrame':
+        """Deferred :py:meth:`VDataFrame.subtract`."""
+        return self._append('subtract', *args, **kwargs)
+
+    def isna(self) -> 'LazyVDataFrame':
+        """Deferred :py:meth:`VDataFrame.isna`."""
+        return self._append('isna')
+
+    def copy(self) -> 'LazyVDataFrame':
+        """Deferred :py:meth:`VDataFrame.copy`."""
+        return self._append('copy')
+
+    def fillna(
+        self, value=None, method=None, axis=None, limit=None, downcast=None
+    ) -> 'LazyVDataFrame':
+        """Deferred :py:meth:`VDataFrame.fillna`, inplace is not supported."""
+        return self._append(
+            'fillna',
+            value=value,
+            method=method,
+            axis=axis,
+            limit=limit,
+            downcast=downcast,
+        )
+
+    def astype(self, dtype, copy: bool = True, errors: str = "raise"):
+        """Deferred :py:meth:`VDataFrame.astype`."""
+        return self._append('astype', dtype=dtype, copy=copy, errors=errors)
+
+    def drop(
+        self,
+        labels=None,
+        axis=0,
+        index=None,
+        columns=None,
+        level=None,
+        errors='raise',
+    ) -> 'LazyVDataFrame':
+        """Deferred :py:meth:`VDataFrame.drop`, inplace is not supported."""
+        return self._append(
+            'drop',
+            labels=labels,
+            axis=axis,
+            index=index,
+            columns=_listed_columns(columns) if columns else None,
+            level=level,
+            errors=errors,
+        )
+
+    def _check_columns(self):
+        """Checks the columns the ops refer to exist, just like the eager methods."""
+        columns = set(self.base.columns)
+        for fn, _, kwargs in self.ops:
+            if fn == 'astype' and isinstance(kwargs['dtype'], dict):
+                referred = list(kwargs['dtype'].keys())
+            elif fn == 'drop' and kwargs['columns'] is not None:
+                referred = kwargs['columns']
+            else:
+                continue
+            for col in referred:
+                if col not in columns:
+                    raise NotFoundError(f'Item {col} does not exist.')
+            if fn == 'drop':
+                columns.difference_update(referred)
+
+    @staticmethod
+    def _combine_similar(
+        ops: List[Tuple[str, tuple, dict]],
+    ) -> List[Tuple[str, tuple, dict]]:
+        combined = []
+        for op in ops:
+            merged = _merge_disjoint_ops(combined[-1], op) if combined else None
+            if merged is None:
+                combined.append(op)
+            else:
+                combined[-1] = merged
+        return combined
+
+    def collect(self) -> VDataFrame:
+        """Runs the deferred transforms.
+
+        Returns:
+            VDataFrame.
+        """
+        if not self.ops:
+            return self.base.copy()
+        self._check_columns()
+        ops = self._combine_similar(self.ops)
+
+        parts = self.base.partitions
+        if any(part.backend != 'pandas' for part in parts.values()):
+            # Only pandas partitions can be fused, replay the ops one by one.
+            return reduce(
+                lambda df, op: getattr(df, op[0])(*op[1], **op[2]), ops, self.base
+            )
+
+        ops = tree_map(lambda x: x.data if isinstance(x, PartitionBase) else x, ops)
+        return VDataFrame(
+            {
+                pyu: type(part)(pyu(_lazy_apply_ops)(part.data, ops))
+                for pyu, part in parts.items()
+            },
+            self.base.aligned,
+        )
@@ -114,6 +114,16 @@ def test_count_should_ok(prod_env_and_data):
     pd.testing.assert_series_equal(reveal(value.data), expected)
 
 
+def test_pandas_dtypes_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['part'].pandas_dtypes()
+
+    # THEN
+    assert reveal(value) == data['df'].dtypes.to_dict()
+    assert data['part'].dtypes == data['df'].dtypes.to_dict()
+
+
 def test_pow_should_ok(prod_env_and_data):
     env, data = prod_env_and_data
     # WHEN
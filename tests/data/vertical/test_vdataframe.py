@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -55,6 +58,121 @@ def test_columns_should_ok(prod_env_and_data):
     np.testing.assert_equal(columns, alice_columns)
 
 
+def test_columns_should_refresh_after_modified(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    value = data['df'].copy()
+    assert value.columns == ['a1', 'a2', 'a3', 'b4', 'b5', 'b6']
+
+    # WHEN
+    value.drop(columns=['a2', 'b5'], inplace=True)
+    # THEN
+    assert value.columns == ['a1', 'a3', 'b4', 'b6']
+    assert value.shape == (4, 4)
+    assert list(value.dtypes.keys()) == ['a1', 'a3', 'b4', 'b6']
+
+    # WHEN
+    value.partitions[env.alice]['a7'] = 'test'
+    # THEN
+    assert value.columns == ['a1', 'a3', 'a7', 'b4', 'b6']
+    assert list(value['a7'].partitions.keys()) == [env.alice]
+
+    # WHEN
+    value.partitions[env.bob]['b8'] = 'test'
+    value.partitions[env.bob]['b9'] = 'test'
+    # THEN
+    assert value.columns == ['a1', 'a3', 'a7', 'b4', 'b6', 'b8', 'b9']
+    assert value.shape == (4, 7)
+    assert list(value['b9'].partitions.keys()) == [env.bob]
+
+
+def test_cache_should_not_keep_replaced_partitions(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    value = data['df'].copy()
+    value.partitions[env.alice]['a7'] = 'test'
+    assert value.columns == ['a1', 'a2', 'a3', 'a7', 'b4', 'b5', 'b6']
+    old_data = weakref.ref(value.partitions[env.alice].data)
+
+    # WHEN
+    value.partitions[env.alice]['a8'] = 'test'
+    gc.collect()
+
+    # THEN
+    assert old_data() is None
+    assert value.columns == ['a1', 'a2', 'a3', 'a7', 'a8', 'b4', 'b5', 'b6']
+
+
+def test_column_owners_should_be_updated_after_modified(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    value = data['df'].copy()
+    value._col_index(['a1', 'b4'])
+
+    # WHEN
+    value.drop(columns=['a2', 'b5'], inplace=True)
+    # THEN
+    value._check_col_to_pyu()
+    assert value._cached_col_to_pyu() == {
+        'a1': env.alice,
+        'a3': env.alice,
+        'b4': env.bob,
+        'b6': env.bob,
+    }
+
+    # WHEN
+    value['b7'] = value.partitions[env.bob]['b4']
+    value.fillna(value=0, inplace=True)
+    # THEN
+    value._check_col_to_pyu()
+    assert value._cached_col_to_pyu()['b7'] == env.bob
+    with pytest.raises(NotFoundError, match='Item a2 does not exist.'):
+        value['a2']
+
+
+def test_drop_column_held_by_two_parties_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    df_alice = pd.DataFrame({'a1': [1, 2], 'c': [3, 4]})
+    df_bob = pd.DataFrame({'b1': [5, 6], 'c': [7, 8]})
+    value = VDataFrame(
+        {
+            env.alice: partition(data=env.alice(lambda: df_alice)()),
+            env.bob: partition(data=env.bob(lambda: df_bob)()),
+        }
+    )
+    assert list(value['c'].partitions.keys()) == [env.alice]
+
+    # WHEN
+    value.drop(columns=['c'], inplace=True)
+
+    # THEN
+    assert value.columns == ['a1', 'b1', 'c']
+    assert list(value['c'].partitions.keys()) == [env.bob]
+
+
+def test_len_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    value = data['df'].copy()
+    assert len(value) == 4
+
+    # WHEN
+    value.drop(index=[0], inplace=True)
+    # THEN
+    assert len(value) == 3
+
+    # WHEN
+    value.partitions[env.alice].drop(index=[1], inplace=True)
+    # THEN
+    assert len(value) == 2
+
+    # WHEN
+    value.aligned = False
+    # THEN
+    assert len(value) == 3
+
+
 def test_pow_should_ok(prod_env_and_data):
     env, data = prod_env_and_data
     # WHEN
@@ -188,6 +306,82 @@ def test_sem_should_ok(prod_env_and_data):
     pd.testing.assert_series_equal(value[['b6']], expected_bob[['b6']])
 
 
+def test_multi_concat_reveal_apply_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df']._multi_concat_reveal_apply(['mean', 'std'], numeric_only=True)
+
+    # THEN
+    for fn in ['mean', 'std']:
+        expected_alice = getattr(data['df_alice'], fn)(numeric_only=True)
+        assert value[fn]['a3'] == expected_alice['a3']
+        expected_bob = getattr(data['df_bob'], fn)(numeric_only=True)
+        pd.testing.assert_series_equal(value[fn][['b4', 'b6']], expected_bob)
+
+
+def test_moments_should_refresh_after_modified(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    value = data['df'].copy()
+    value.std(numeric_only=True)
+
+    # WHEN
+    value.fillna(value=0, inplace=True)
+
+    # THEN
+    expected_bob = data['df_bob'].fillna(0)
+    pd.testing.assert_series_equal(
+        value.mean(numeric_only=True)[['b4', 'b6']],
+        expected_bob.mean(numeric_only=True),
+    )
+    pd.testing.assert_series_equal(
+        value.sem(numeric_only=True)[['b4', 'b6']],
+        expected_bob.sem(numeric_only=True),
+    )
+
+
+def test_moments_on_all_numeric_columns_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    value = data['df'][['a3', 'b4', 'b6']]
+    expected = pd.concat(
+        [data['df_alice'][['a3']], data['df_bob'][['b4', 'b6']]], axis=1
+    )
+
+    # WHEN / THEN
+    for fn in ('var', 'std', 'sem', 'mean'):
+        pd.testing.assert_series_equal(getattr(value, fn)(), getattr(expected, fn)())
+
+
+def test_moments_on_datetime_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    df_alice = pd.DataFrame(
+        {'a1': pd.to_datetime(['2023-01-01', '2023-01-03', '2023-01-08'])}
+    )
+    df_bob = pd.DataFrame(
+        {
+            'b1': pd.to_timedelta(['1 days', '3 days', '8 days']),
+            'b2': [1.0, 2.5, 4.0],
+        }
+    )
+    value = VDataFrame(
+        {
+            env.alice: partition(data=env.alice(lambda: df_alice)()),
+            env.bob: partition(data=env.bob(lambda: df_bob)()),
+        }
+    )
+
+    # WHEN
+    mean = value.mean()
+    std = value[['b1', 'b2']].std()
+
+    # THEN
+    assert mean['a1'] == df_alice['a1'].mean()
+    pd.testing.assert_series_equal(mean[['b1', 'b2']], df_bob.mean())
+    pd.testing.assert_series_equal(std, df_bob.std())
+
+
 def test_skew_should_ok(prod_env_and_data):
     env, data = prod_env_and_data
     # WHEN
@@ -256,6 +450,18 @@ def test_get_single_item_should_ok(prod_env_and_data):
     )
 
 
+def test_get_items_should_keep_columns(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df'][['b6', 'a3', 'a1']]
+
+    # THEN
+    value._check_col_to_pyu()
+    assert value.columns == ['b6', 'a3', 'a1']
+    assert reveal(value.partitions[env.bob].data).columns.to_list() == ['b6']
+    assert reveal(value.partitions[env.alice].data).columns.to_list() == ['a3', 'a1']
+
+
 def test_get_non_exist_items_should_error(prod_env_and_data):
     env, data = prod_env_and_data
     # WHEN and THEN
@@ -367,6 +573,34 @@ def test_set_item_on_vdataframe_should_ok(prod_env_and_data):
     pd.testing.assert_frame_equal(reveal(value.partitions[env.bob].data), expected_bob)
 
 
+def test_set_new_item_on_vdataframe_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    df_alice = pd.DataFrame({'a7': [1, 2, 3, 4]})
+    df_bob = pd.DataFrame({'b7': ['B1', 'B2', 'B3', 'B4'], 'b8': [5, 6, 7, 8]})
+    new_df = VDataFrame(
+        {
+            env.alice: partition(data=env.alice(lambda: df_alice)()),
+            env.bob: partition(data=env.bob(lambda: df_bob)()),
+        }
+    )
+
+    # WHEN
+    value = data['df']
+    value[['a7', 'b7', 'b8']] = new_df
+
+    # THEN
+    assert value.columns == ['a1', 'a2', 'a3', 'a7', 'b4', 'b5', 'b6', 'b7', 'b8']
+    expected_alice = data['df_alice'].copy(deep=True)
+    expected_alice['a7'] = df_alice['a7']
+    pd.testing.assert_frame_equal(
+        reveal(value.partitions[env.alice].data), expected_alice
+    )
+    expected_bob = data['df_bob'].copy(deep=True)
+    expected_bob[['b7', 'b8']] = df_bob
+    pd.testing.assert_frame_equal(reveal(value.partitions[env.bob].data), expected_bob)
+
+
 def test_set_item_on_different_vdataframe_should_error(prod_env_and_data):
     env, data = prod_env_and_data
     with pytest.raises(
@@ -403,6 +637,18 @@ def test_set_item_on_different_vdataframe_should_error(prod_env_and_data):
         value[['a1', 'b4']] = df[['a2', 'b5']]
 
 
+def test_column_values_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df'].column_values(['a3', 'b4', 'b6'])
+
+    # THEN
+    assert list(value.keys()) == ['a3', 'b4', 'b6']
+    np.testing.assert_equal(reveal(value['a3']), data['df_alice']['a3'].values)
+    np.testing.assert_equal(reveal(value['b4']), data['df_bob']['b4'].values)
+    np.testing.assert_equal(reveal(value['b6']), data['df_bob']['b6'].values)
+
+
 def test_drop(prod_env_and_data):
     env, data = prod_env_and_data
     # Case 1: not inplace.
@@ -432,6 +678,36 @@ def test_drop(prod_env_and_data):
     )
 
 
+def test_drop_should_not_share_partitions(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    df = data['df'].copy()
+    value = df.drop(columns='a1', inplace=False)
+
+    # WHEN
+    value['b4'] = 1
+    value.fillna(value='test', inplace=True)
+
+    # THEN
+    assert value.partitions[env.bob] is not df.partitions[env.bob]
+    pd.testing.assert_frame_equal(reveal(df.partitions[env.bob].data), data['df_bob'])
+    assert df.columns == ['a1', 'a2', 'a3', 'b4', 'b5', 'b6']
+
+
+def test_to_pandas_should_not_share_partitions(prod_env_and_data):
+    env, data = prod_env_and_data
+    # GIVEN
+    df = data['df'].copy()
+    value = df.to_pandas()
+
+    # WHEN
+    value.fillna(value='test', inplace=True)
+
+    # THEN
+    assert value.partitions[env.bob] is not df.partitions[env.bob]
+    pd.testing.assert_frame_equal(reveal(df.partitions[env.bob].data), data['df_bob'])
+
+
 def test_replace_should_ok(prod_env_and_data):
     env, data = prod_env_and_data
     val = data['df_alice'].iloc[1, 1]
@@ -510,3 +786,45 @@ def test_astype_should_ok(prod_env_and_data):
         reveal(new_df.partitions[env.bob].data),
         data['df_bob'][['b4']].fillna(1),
     )
+
+
+def test_lazy_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = (
+        data['df']
+        .lazy()
+        .fillna(value=1)
+        .astype({'a3': np.int32})
+        .astype({'b4': np.float32})
+        .drop(columns=['a1', 'b5'])
+        .collect()
+    )
+
+    # THEN
+    pd.testing.assert_frame_equal(
+        reveal(value.partitions[env.alice].data),
+        data['df_alice'].fillna(1).astype({'a3': np.int32}).drop(columns='a1'),
+    )
+    pd.testing.assert_frame_equal(
+        reveal(value.partitions[env.bob].data),
+        data['df_bob'].fillna(1).astype({'b4': np.float32}).drop(columns='b5'),
+    )
+
+
+def test_lazy_on_non_exist_column_should_error(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN & THEN
+    with pytest.raises(NotFoundError, match='does not exist.'):
+        data['df'].lazy().drop(columns='a1').astype({'a1': np.int32}).collect()
+
+
+def test_reveal_to_pandas_should_ok(prod_env_and_data):
+    env, data = prod_env_and_data
+    # WHEN
+    value = data['df'].reveal_to_pandas()
+
+    # THEN
+    pd.testing.assert_frame_equal(
+        value, pd.concat([data['df_alice'], data['df_bob']], axis=1)
+    )